@@ -1,6 +1,12 @@
 """
 Provide functionality for converting between imperial and metric system.
 """
+# Conversion factors, with the reciprocals precomputed so that all conversions are multiplications.
+_KG_PER_LB = 0.45359237
+_LB_PER_KG = 1.0 / 0.45359237
+_M_PER_FT = 0.3048
+_FT_PER_M = 1.0 / 0.3048
+_J_PER_FTLB = 1.355818
 
 
 class Conversion:
@@ -26,7 +32,7 @@ class Conversion:
         mass : float
             Mass in [kg].
         """
-        return mass / 0.45359237
+        return mass * _LB_PER_KG
 
     @staticmethod
     def lbs_to_kg(mass):
@@ -42,7 +48,7 @@ class Conversion:
         mass : float
             Mass in [lbs].
         """
-        return mass * 0.45359237
+        return mass * _KG_PER_LB
 
     @staticmethod
     def ft_to_m(length):
@@ -58,7 +64,7 @@ class Conversion:
         length : float
             Length in [m].
         """
-        return length * 0.3048
+        return length * _M_PER_FT
 
     @staticmethod
     def m_to_ft(length):
@@ -74,7 +80,7 @@ class Conversion:
         length : float
             Length in [ft].
         """
-        return length / 0.3048
+        return length * _FT_PER_M
 
     @staticmethod
     def ftlb_to_J(energy):
@@ -90,4 +96,4 @@ class Conversion:
         energy : float
             Kinetic energy in [J].
         """
-        return energy * 1.355818
+        return energy * _J_PER_FTLB
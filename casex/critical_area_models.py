@@ -1,9 +1,9 @@
 """
 This class provide methods for computing critical area for a variety of models.
 """
+import functools
 import math
 import warnings
-from collections.abc import Iterable
 
 import numpy as np
 
@@ -37,6 +37,9 @@ class CriticalAreaModels:
         [m] The altitude above the ground at which the aircraft can first impact a person (the default is 1.8 m).
     """
 
+    # Default lethal kinetic energy threshold in the NAWCAD model, 54 ft-lbs converted to J.
+    _NAWCAD_KE_LETHAL = Conversion.ftlb_to_J(54)
+
     def __init__(self, buffer=0.3, height=1.8):
         self.buffer = buffer
         self.height = height
@@ -113,78 +116,168 @@ class CriticalAreaModels:
         if not isinstance(aircraft, aircraft_specs.AircraftSpecs):
             raise exceptions.InvalidAircraftError("Aircraft not recognized. Must be of type AircraftSpecs.")
 
-        # Instantiate necessary classes.
-        exp = explosion_models.ExplosionModels()
-
-        # Compute additional parameters.
-        horizontal_impact_speed = self.horizontal_speed_from_angle(impact_angle, impact_speed)
+        # Compute additional parameters. The cosine of the impact angle is needed in more than one place, so it is
+        # only computed once.
+        if np.ndim(impact_angle) == 0:
+            cos_impact_angle = math.cos(math.radians(impact_angle))
+        else:
+            cos_impact_angle = np.cos(np.radians(impact_angle))
+        horizontal_impact_speed = self._horizontal_speed_from_cos(cos_impact_angle, impact_speed)
         glide_distance = self.glide_distance(impact_angle)
 
+        # The radius of the aircraft plus a person, and the circular area, as used in several models.
+        r_body = self.buffer + aircraft.width / 2
+        circular_end = math.pi * r_body * r_body
+
         # Compute the inert LA.
-        if critical_area_model == enums.CriticalAreaModel.RCC:
-            # Slide distance based on friction.
-            slide_distance_friction = self.slide_distance_friction(horizontal_impact_speed,
-                                                                   aircraft.friction_coefficient)
-            # [RCC, p. D-4]
-            glide_area = np.multiply(aircraft.length + glide_distance + 2 * self.buffer,
-                                     aircraft.width + 2 * self.buffer)
-            slide_area = np.multiply(slide_distance_friction, aircraft.width + 2 * self.buffer)
-
-        elif critical_area_model == enums.CriticalAreaModel.RTI:
-            # Slide distance based on friction.
-            slide_distance_friction = self.slide_distance_friction(
-                aircraft.coefficient_of_restitution * horizontal_impact_speed, aircraft.friction_coefficient)
-
-            # [1, p. 6]
-            glide_area = 2 * (self.buffer + aircraft.width / 2) * glide_distance + math.pi * np.power(
-                self.buffer + aircraft.width / 2, 2)
-            slide_area = slide_distance_friction * (2 * self.buffer + aircraft.width)
-
-        elif critical_area_model == enums.CriticalAreaModel.FAA:
-            # [FAA, p. 99]
-            r_D = self.buffer + aircraft.width / 2
-
-            # F_A comes from table 6-5 in [FAA, p. 98]. Here using the median for 20/80 distribution between hard and
-            # soft surfaces.
-            if var1 == -1:
-                F_A = 4.36
-            else:
-                F_A = var1
+        glide_area, slide_area = self._DISPATCH[critical_area_model](self, aircraft, horizontal_impact_speed,
+                                                                     glide_distance, cos_impact_angle=cos_impact_angle,
+                                                                     r_body=r_body, circular_end=circular_end,
+                                                                     var1=var1)
 
-            r_Ac = self.buffer + aircraft.width / 2 * np.sqrt(F_A)
-            hs = self.height * np.sin(np.deg2rad(90 - impact_angle))
-            y2m = np.power(2 * r_Ac * hs, 2) - np.power(np.power(r_Ac, 2) + np.power(hs, 2) - np.power(r_D, 2), 2)
+        # Add glide and slide from model.
+        LA_inert = glide_area + slide_area
+
+        # Compute deflagration area. It does not depend on the impact, so for a scalar fuel quantity it is cached.
+        if np.ndim(aircraft.fuel_quantity) == 0:
+            LA_deflagration = self._deflagration_area_scalar(aircraft.fuel_type, float(aircraft.fuel_quantity))
+        else:
+            LA_deflagration = self._deflagration_area(aircraft.fuel_type, aircraft.fuel_quantity)
+
+        # Compute the overlapping area between inert and deflagration.
+        overlapping_area = np.minimum(LA_inert, LA_deflagration) * np.maximum(0, np.minimum(critical_areas_overlap, 1))
 
-            # If y2m becomes negative, it means that A_C_mark should become zero, because the secondary
-            # debris area is larger than the total glide area. This is accomplished by simply setting y2 = 0.
-            y2m = np.maximum(0, y2m)
-            y2 = np.sqrt(y2m) / (2 * hs)
+        return LA_inert + LA_deflagration - overlapping_area, glide_area, slide_area, LA_inert, LA_deflagration
 
-            A_C_mark = 2 * y2 * hs
-            A_C_mark = A_C_mark + (
-                    y2 * np.sqrt(np.power(r_D, 2) - np.power(y2, 2)) + np.power(r_D, 2) * np.arcsin(y2 / r_D))
-            A_C_mark = A_C_mark - (
-                    y2 * np.sqrt(np.power(r_Ac, 2) - np.power(y2, 2)) + np.power(r_Ac, 2) * np.arcsin(y2 / r_Ac))
+    @staticmethod
+    def _deflagration_area(fuel_type, fuel_quantity):
+        """
+        Compute deflagration area based on both fireball and thermal lethal area.
+        """
+        exp = explosion_models.ExplosionModels()
 
-            # Note that this is not identical to (12), since (12) assumes 0 degrees is vertical and not horizontal.
-            LA_inert = math.pi * np.power(self.buffer + aircraft.width / 2 * np.sqrt(F_A), 2) + A_C_mark
+        TNT = exp.TNT_equivalent_mass(fuel_type, fuel_quantity)
+        FB = exp.fireball_area(TNT)
+        p_lethal = 0.1
+        TLA = exp.lethal_area_thermal(TNT, p_lethal)
 
-            glide_area = math.pi * np.power(self.buffer + aircraft.width / 2, 2)
-            slide_area = LA_inert - glide_area
+        return np.maximum(FB, TLA)
 
-        elif critical_area_model == enums.CriticalAreaModel.NAWCAD:
-            # All from NAWCAD model
-            if var1 == -1:
-                KE_lethal = Conversion.ftlb_to_J(54)
-            else:
-                KE_lethal = var1
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _deflagration_area_scalar(fuel_type, fuel_quantity):
+        """
+        Compute deflagration area for a scalar fuel quantity.
+
+        The result is cached, since the fuel is typically the same for many calls to :meth:`critical_area`.
+        """
+        return CriticalAreaModels._deflagration_area(fuel_type, fuel_quantity)
+
+    def _compute_rcc(self, aircraft, horizontal_impact_speed, glide_distance, **kwargs):
+        """
+        Compute the glide and slide areas for the RCC model.
+
+        See :meth:`critical_area` for a description of the arguments. Arguments not used by this model are ignored.
+        """
+        # Slide distance based on friction.
+        slide_distance_friction = self.slide_distance_friction(horizontal_impact_speed,
+                                                               aircraft.friction_coefficient)
+        # [RCC, p. D-4]
+        glide_area = np.multiply(aircraft.length + glide_distance + 2 * self.buffer,
+                                 aircraft.width + 2 * self.buffer)
+        slide_area = np.multiply(slide_distance_friction, aircraft.width + 2 * self.buffer)
+
+        return glide_area, slide_area
+
+    def _compute_rti(self, aircraft, horizontal_impact_speed, glide_distance, r_body, circular_end, **kwargs):
+        """
+        Compute the glide and slide areas for the RTI model.
+
+        See :meth:`critical_area` for a description of the arguments. Arguments not used by this model are ignored.
+        """
+        # Slide distance based on friction.
+        slide_distance_friction = self.slide_distance_friction(
+            aircraft.coefficient_of_restitution * horizontal_impact_speed, aircraft.friction_coefficient)
+
+        # [1, p. 6]
+        glide_area = 2 * r_body * glide_distance + circular_end
+        slide_area = slide_distance_friction * (2 * self.buffer + aircraft.width)
+
+        return glide_area, slide_area
+
+    def _compute_faa(self, aircraft, horizontal_impact_speed, glide_distance, cos_impact_angle, r_body,
+                     circular_end, var1, **kwargs):
+        """
+        Compute the glide and slide areas for the FAA model.
+
+        See :meth:`critical_area` for a description of the arguments. Arguments not used by this model are ignored.
+        """
+        # [FAA, p. 99]
+        half_width = aircraft.width / 2
+        r_D = r_body
+
+        # F_A comes from table 6-5 in [FAA, p. 98]. Here using the median for 20/80 distribution between hard and
+        # soft surfaces.
+        if var1 == -1:
+            F_A = 4.36
+        else:
+            F_A = var1
+
+        r_Ac = self.buffer + half_width * np.sqrt(F_A)
+        # Since sin(90 - angle) = cos(angle). Note that for an impact angle of 90 degrees, the cosine is about 6e-17
+        # rather than exactly zero, so the FAA model returns the finite limit (the inert LA is pi * r_Ac^2). Earlier
+        # versions computed sin(0) = 0 here, which made y2 = 0/0 and all areas NaN.
+        hs = self.height * cos_impact_angle
+
+        # Squares used repeatedly below.
+        r_D2 = r_D * r_D
+        r_Ac2 = r_Ac * r_Ac
+        hs2 = hs * hs
+
+        radius_term = r_Ac2 + hs2 - r_D2
+        y2m = 4 * r_Ac2 * hs2 - radius_term * radius_term
+
+        # If y2m becomes negative, it means that A_C_mark should become zero, because the secondary
+        # debris area is larger than the total glide area. This is accomplished by simply setting y2 = 0.
+        y2m = np.maximum(0, y2m)
+        y2 = np.sqrt(y2m) / (2 * hs)
+        y2_2 = y2 * y2
+
+        A_C_mark = 2 * y2 * hs
+        A_C_mark = A_C_mark + (y2 * np.sqrt(r_D2 - y2_2) + r_D2 * np.arcsin(y2 / r_D))
+        A_C_mark = A_C_mark - (y2 * np.sqrt(r_Ac2 - y2_2) + r_Ac2 * np.arcsin(y2 / r_Ac))
+
+        # Note that this is not identical to (12), since (12) assumes 0 degrees is vertical and not horizontal.
+        LA_inert = math.pi * r_Ac2 + A_C_mark
 
-            # P. 18 (the following equation is just KE to mass and velocity, not taken from NAWCAD)
-            velocity_min_kill = np.sqrt(2 * KE_lethal / aircraft.mass)
+        glide_area = circular_end
+        slide_area = LA_inert - glide_area
 
-            # Intermediate variable
-            acceleration = aircraft.friction_coefficient * constants.GRAVITY
+        return glide_area, slide_area
 
+    def _compute_nawcad(self, aircraft, horizontal_impact_speed, glide_distance, var1, **kwargs):
+        """
+        Compute the glide and slide areas for the NAWCAD model.
+
+        See :meth:`critical_area` for a description of the arguments. Arguments not used by this model are ignored.
+        """
+        # All from NAWCAD model
+        if var1 == -1:
+            KE_lethal = self._NAWCAD_KE_LETHAL
+        else:
+            KE_lethal = var1
+
+        # P. 18 (the following equation is just KE to mass and velocity, not taken from NAWCAD)
+        velocity_min_kill = np.sqrt(2 * KE_lethal / aircraft.mass)
+
+        # Intermediate variable
+        acceleration = aircraft.friction_coefficient * constants.GRAVITY
+
+        # For scalar input below the lethal speed, t_safe below is zero, and so is the lethal skid distance.
+        if (np.ndim(horizontal_impact_speed) == 0 and np.ndim(velocity_min_kill) == 0
+                and horizontal_impact_speed <= velocity_min_kill):
+            skid_distance_lethal = 0.0
+        else:
             # P. 17
             # This is (15), but it seems to be wrong; normally at = v, not 2at = v
             # t_safe = (horizontal_impact_speed - velocity_min_kill) / 2 / aircraft.friction_coefficient / constants.GRAVITATIONAL
@@ -197,55 +290,62 @@ class CriticalAreaModels:
             # P. 17
             skid_distance_lethal = (horizontal_impact_speed * t_safe) - (0.5 * acceleration * t_safe * t_safe)
 
-            # P. 25
-            glide_area = glide_distance * (2 * self.buffer + aircraft.width)
-            slide_area = skid_distance_lethal * (2 * self.buffer + aircraft.width)
-
-        elif critical_area_model == enums.CriticalAreaModel.JARUS:
-            if var1 == -1:
-                # Set default value for a scalar width.
-                if not isinstance(aircraft.width, np.ndarray):
-                    if aircraft.width <= 1:
-                        KE_lethal = 290
-                    else:
-                        KE_lethal = 290 * 2
-                # Set default value for array width.
+        # P. 25
+        glide_area = glide_distance * (2 * self.buffer + aircraft.width)
+        slide_area = skid_distance_lethal * (2 * self.buffer + aircraft.width)
+
+        return glide_area, slide_area
+
+    def _compute_jarus(self, aircraft, horizontal_impact_speed, glide_distance, r_body, circular_end, var1, **kwargs):
+        """
+        Compute the glide and slide areas for the JARUS model.
+
+        See :meth:`critical_area` for a description of the arguments. Arguments not used by this model are ignored.
+        """
+        if var1 == -1:
+            # Set default value for a scalar width.
+            if not isinstance(aircraft.width, np.ndarray):
+                if aircraft.width <= 1:
+                    KE_lethal = 290
                 else:
-                    KE_lethal = np.full(len(aircraft.width), 290)
-                    KE_lethal = np.where(aircraft.width <= 1, KE_lethal, 2 * KE_lethal)
+                    KE_lethal = 290 * 2
+            # Set default value for array width.
             else:
-                KE_lethal = var1
-
-            velocity_min_kill = np.sqrt(2 * KE_lethal / aircraft.mass)
-            acceleration = aircraft.friction_coefficient * constants.GRAVITY
+                KE_lethal = np.full(len(aircraft.width), 290)
+                KE_lethal = np.where(aircraft.width <= 1, KE_lethal, 2 * KE_lethal)
+        else:
+            KE_lethal = var1
 
-            t_safe = (aircraft.coefficient_of_restitution * horizontal_impact_speed - velocity_min_kill) / acceleration
-            t_safe = np.maximum(0, t_safe)
+        velocity_min_kill = np.sqrt(2 * KE_lethal / aircraft.mass)
+        acceleration = aircraft.friction_coefficient * constants.GRAVITY
 
-            slide_distance_lethal = (aircraft.coefficient_of_restitution * horizontal_impact_speed * t_safe) - (
-                    0.5 * acceleration * t_safe * t_safe)
+        slide_speed = aircraft.coefficient_of_restitution * horizontal_impact_speed
 
-            if aircraft.width < 1:
-                slide_distance_lethal = 0
+        # For scalar input below the lethal speed, t_safe below is zero, and so is the lethal slide distance.
+        if np.ndim(slide_speed) == 0 and np.ndim(velocity_min_kill) == 0 and slide_speed <= velocity_min_kill:
+            slide_distance_lethal = 0.0
+        else:
+            t_safe = (slide_speed - velocity_min_kill) / acceleration
+            t_safe = np.maximum(0, t_safe)
 
-            circular_end = math.pi * np.power(self.buffer + aircraft.width / 2, 2)
-            glide_area = 2 * (self.buffer + aircraft.width / 2) * glide_distance + circular_end
-            slide_area = slide_distance_lethal * (2 * self.buffer + aircraft.width)
+            slide_distance_lethal = (slide_speed * t_safe) - (0.5 * acceleration * t_safe * t_safe)
 
-        # Add glide and slide from model.
-        LA_inert = glide_area + slide_area
+        if aircraft.width < 1:
+            slide_distance_lethal = 0
 
-        # Compute deflagration area based on both fireball and thermal lethal area.
-        TNT = exp.TNT_equivalent_mass(aircraft.fuel_type, aircraft.fuel_quantity)
-        FB = exp.fireball_area(TNT)
-        p_lethal = 0.1
-        TLA = exp.lethal_area_thermal(TNT, p_lethal)
-        LA_deflagration = np.maximum(FB, TLA)
+        glide_area = 2 * r_body * glide_distance + circular_end
+        slide_area = slide_distance_lethal * (2 * self.buffer + aircraft.width)
 
-        # Compute the overlapping area between inert and deflagration.
-        overlapping_area = np.minimum(LA_inert, LA_deflagration) * np.maximum(0, np.minimum(critical_areas_overlap, 1))
+        return glide_area, slide_area
 
-        return LA_inert + LA_deflagration - overlapping_area, glide_area, slide_area, LA_inert, LA_deflagration
+    # Functions computing the glide and slide areas for each of the critical area models.
+    _DISPATCH = {
+        enums.CriticalAreaModel.RCC: _compute_rcc,
+        enums.CriticalAreaModel.RTI: _compute_rti,
+        enums.CriticalAreaModel.FAA: _compute_faa,
+        enums.CriticalAreaModel.NAWCAD: _compute_nawcad,
+        enums.CriticalAreaModel.JARUS: _compute_jarus,
+    }
 
     @staticmethod
     def slide_distance_friction(velocity, friction_coefficient):
@@ -323,24 +423,45 @@ class CriticalAreaModels:
         glide_angle : float
             [deg] The glide angle, which is either the same as the input, or flipped if needed.
         """
+        out_of_range_warning = "glide_angle is out of valid range (0 to 180). Subsequent computations are not valid."
+        too_small_warning = ("glide_angle is very small, and may produce numerically unstable results."
+                             " Glide angle has been set to 1 degree.")
+
+        # Scalar input is checked with plain comparisons, since going through NumPy is much slower for a scalar.
+        if np.ndim(glide_angle) == 0:
+            # glide_angle out of range.
+            if glide_angle < 0 or glide_angle > 180:
+                warnings.warn(out_of_range_warning)
+                glide_angle = 90
+
+            # Flip glide angle.
+            if glide_angle > 90:
+                glide_angle = 180 - glide_angle
+
+            # If glide_angle is close to zero, we get a division by close to zero, so warn the user.
+            # Also avoids an division by zero error.
+            if glide_angle < 1:
+                warnings.warn(too_small_warning)
+                glide_angle = 1
+
+            return float(glide_angle)
+
+        glide_angle = np.asarray(glide_angle, dtype=np.float64)
+
         # glide_angle out of range.
-        if np.any(glide_angle < 0) or np.any(glide_angle > 180):
-            warnings.warn("glide_angle is out of valid range (0 to 180). Subsequent computations are not valid.")
-            glide_angle = np.fromiter(map(lambda x: 90 if (x < 0 or x > 180) else x, glide_angle), dtype=np.float)
+        out_of_range = (glide_angle < 0) | (glide_angle > 180)
+        if np.any(out_of_range):
+            warnings.warn(out_of_range_warning)
+            glide_angle = np.where(out_of_range, 90.0, glide_angle)
 
         # Flip glide angle.
-        if isinstance(glide_angle, Iterable):
-            glide_angle = np.fromiter(map(lambda x: 180 - x if x > 90 else x, glide_angle), dtype=np.float)
-        else:
-            if glide_angle > 90:
-                glide_angle = 180 - glide_angle
+        glide_angle = np.where(glide_angle > 90, 180.0 - glide_angle, glide_angle)
 
         # If glide_angle is close to zero, we get a division by close to zero, so warn the user.
         # Also avoids an division by zero error.
         if np.any(glide_angle < 1):
-            warnings.warn("glide_angle is very small, and may produce numerically unstable results."
-                          " Glide angle has been set to 1 degree.")
-            glide_angle = np.fromiter(map(lambda x: 1 if x < 1 else x, glide_angle), dtype=np.float)
+            warnings.warn(too_small_warning)
+            glide_angle = np.maximum(glide_angle, 1.0)
 
         return glide_angle
 
@@ -355,13 +476,31 @@ class CriticalAreaModels:
         impact_speed : float
             [m/s] Impact speed of the aircraft (speed in the direction of travel).
 
+        Returns
+        -------
+        horizontal_speed : float
+            [m/s] The horizontal compotent of the impact speed.
+        """
+        return CriticalAreaModels._horizontal_speed_from_cos(np.cos(np.radians(impact_angle)), impact_speed)
+
+    @staticmethod
+    def _horizontal_speed_from_cos(cos_impact_angle, impact_speed):
+        """Compute horizontal speed component for a given cosine of the impact angle and impact speed.
+
+        Parameters
+        ----------
+        cos_impact_angle : float
+            [-] Cosine of the impact angle of the aircraft.
+        impact_speed : float
+            [m/s] Impact speed of the aircraft (speed in the direction of travel).
+
         Returns
         -------
         horizontal_speed : float
             [m/s] The horizontal compotent of the impact speed.
         """
         # Note that we use .abs, since cosine is negative for angles between 90 and 180.
-        return np.fabs(np.cos(np.radians(impact_angle))) * impact_speed
+        return np.fabs(cos_impact_angle) * impact_speed
 
     @staticmethod
     def horizontal_speed_from_ratio(glide_ratio, impact_speed):
@@ -379,7 +518,7 @@ class CriticalAreaModels:
         horizontal_speed : float
             [m/s] The horizontal compotent of the impact speed.
         """
-        return (glide_ratio / np.power(np.power(glide_ratio, 2) + 1, 0.5)) * impact_speed
+        return glide_ratio / np.sqrt(glide_ratio * glide_ratio + 1) * impact_speed
 
     @staticmethod
     def vertical_speed_from_angle(impact_angle, impact_speed):